@@ -1,8 +1,13 @@
 import asyncio
 import base64
-import os
 import logging
+import copy
+import re
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, NamedTuple, Optional
 
+import httpx
 from deepgram import AsyncDeepgramClient
 from deepgram.core.events import EventType
 from deepgram.listen.v2.socket_client import AsyncV2SocketClient
@@ -15,7 +20,7 @@ from plivo import plivoxml
 from plivo.xml import StreamElement
 from plivo_stream import ClearedAudioEvent, DtmfEvent, PlayedStreamEvent, PlivoFastAPIStreamingHandler, MediaEvent, StartEvent
 from plivo_stream import __version__ as plivo_stream_version
-from utils import validate_and_normalize_env, env_flag, get_log_level_from_env
+from utils import validate_and_normalize_env, get_log_level_from_env
 
 load_dotenv()
 
@@ -30,72 +35,206 @@ logger.setLevel(get_log_level_from_env())
 # Configuration & API Keys
 # ============================================================================
 
-# Validate and normalize before reading configuration
-validate_and_normalize_env()
+# Validate and normalize once; request handlers only read the resulting config
+CONFIG = validate_and_normalize_env()
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
-DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY")
+OPENAI_API_KEY = CONFIG.openai_api_key
+ELEVENLABS_API_KEY = CONFIG.elevenlabs_api_key
+DEEPGRAM_API_KEY = CONFIG.deepgram_api_key
 
 # Audio configuration
-AUDIO_SAMPLE_RATE = int(os.getenv("AUDIO_SAMPLE_RATE"))
-AUDIO_CONTENT_TYPE = os.getenv("AUDIO_CONTENT_TYPE")
-RECORDING_CALLBACK_URL = os.getenv("RECORDING_CALLBACK_URL")
+AUDIO_SAMPLE_RATE = CONFIG.audio_sample_rate
+AUDIO_CONTENT_TYPE = CONFIG.audio_content_type
+STREAM_CONTENT_TYPE = f"{AUDIO_CONTENT_TYPE};rate={AUDIO_SAMPLE_RATE}"
+# Request audio from ElevenLabs, and send it to Deepgram, in exactly the format Plivo
+# streams so no resampling or transcoding is needed anywhere on the path
+if AUDIO_CONTENT_TYPE == "audio/x-mulaw":
+    ELEVENLABS_OUTPUT_FORMAT = "ulaw_8000"
+    DEEPGRAM_ENCODING = "mulaw"
+    # 8-bit mu-law: one byte per sample
+    AUDIO_BYTES_PER_SECOND = AUDIO_SAMPLE_RATE
+else:
+    ELEVENLABS_OUTPUT_FORMAT = f"pcm_{AUDIO_SAMPLE_RATE}"
+    DEEPGRAM_ENCODING = "linear16"
+    # PCM16 mono: two bytes per sample
+    AUDIO_BYTES_PER_SECOND = AUDIO_SAMPLE_RATE * 2
+# Caller audio is forwarded to Deepgram in ~40 ms batches (two 20 ms Plivo frames)
+DEEPGRAM_BATCH_MS = 40
+DEEPGRAM_BATCH_BYTES = AUDIO_BYTES_PER_SECOND * DEEPGRAM_BATCH_MS // 1000
 
 # Model configuration
-OPENAI_MODEL = os.getenv("OPENAI_MODEL")
-DEEPGRAM_MODEL = os.getenv("DEEPGRAM_MODEL")
-ELEVENLABS_VOICE_ID = os.getenv("ELEVENLABS_VOICE_ID")
-ELEVENLABS_MODEL_ID = os.getenv("ELEVENLABS_MODEL_ID")
+OPENAI_MODEL = CONFIG.openai_model
+DEEPGRAM_MODEL = CONFIG.deepgram_model
+ELEVENLABS_VOICE_ID = CONFIG.elevenlabs_voice_id
+ELEVENLABS_MODEL_ID = CONFIG.elevenlabs_model_id
 
 # System prompt
-SYSTEM_PROMPT = os.getenv("SYSTEM_PROMPT")
+SYSTEM_PROMPT = CONFIG.system_prompt
+# Built once and reused for every request. Keeping this static prefix first in the
+# messages also lets OpenAI's automatic prompt caching reuse it across turns.
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Speculative responses: start the LLM on Deepgram's EagerEndOfTurn and only play the
+# result if EndOfTurn confirms the same transcript. Can up to double OpenAI usage.
+ENABLE_SPECULATIVE_RESPONSES = CONFIG.enable_speculative_responses
+DEEPGRAM_EAGER_EOT_THRESHOLD = CONFIG.deepgram_eager_eot_threshold
+
+# Keep only the last 10 pairs (20 messages) of conversation history
+MAX_HISTORY_MESSAGES = 20
+
+# LLM output is flushed to TTS at sentence ends, or once a chunk grows past this many words.
+# Punctuation only ends a sentence once whitespace follows it, so "$3.50" and "plivo.com"
+# stay intact, and a period after a common title abbreviation never does.
+TITLE_ABBREVIATIONS = ("Mr", "Mrs", "Ms", "Dr", "Prof", "St")
+SENTENCE_END_PATTERN = re.compile(
+    "".join(rf"(?<!\b{abbreviation})" for abbreviation in TITLE_ABBREVIATIONS) + r"[.?!]+\s+"
+)
+LAST_WORD_PATTERN = re.compile(r"\S+\s*$")
+MAX_TTS_CHUNK_WORDS = 80
 
 # ============================================================================
 # Client Initialization
 # ============================================================================
 
-openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
-elevenlabs_client = AsyncElevenLabs(api_key=ELEVENLABS_API_KEY)
+# Shared HTTP/2 connection pools so concurrent streamed requests multiplex over warm connections.
+# Idle connections are kept for a long time so warmed-up connections survive until the next call.
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32, keepalive_expiry=300.0)
+# Startup warm-up must not hold up the application if an API is slow or unreachable
+STARTUP_WARM_UP_TIMEOUT = 5.0
+openai_http_client = httpx.AsyncClient(http2=True, limits=HTTP_LIMITS)
+elevenlabs_http_client = httpx.AsyncClient(http2=True, limits=HTTP_LIMITS)
+
+openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=openai_http_client)
+elevenlabs_client = AsyncElevenLabs(api_key=ELEVENLABS_API_KEY, httpx_client=elevenlabs_http_client)
 deepgram_client = AsyncDeepgramClient(api_key=DEEPGRAM_API_KEY)
 
-# Conversation history is tracked per session stream ID within the websocket handler
+# Conversation history is tracked per websocket connection within the websocket handler
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
 
-async def get_openai_response(history: list[dict]) -> str:
-    """Get a response from OpenAI based on provided conversation history."""
+def find_sentence_end(text: str) -> int:
+    """Return the offset up to which the buffered LLM text can be sent to TTS, or 0 to keep buffering."""
+    end = 0
+    for match in SENTENCE_END_PATTERN.finditer(text):
+        end = match.end()
+    if not end and len(text.split()) > MAX_TTS_CHUNK_WORDS:
+        # No sentence end in sight: cut before the last word, which may still be incomplete
+        end = LAST_WORD_PATTERN.search(text).start()
+    return end
+
+
+async def get_openai_response(history: deque[dict]) -> AsyncIterator[str]:
+    """Stream a response from OpenAI, yielding text deltas as they arrive."""
     response = await openai_client.chat.completions.create(
         model=OPENAI_MODEL,
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            *history,
-        ],
+        messages=[SYSTEM_MESSAGE, *history],
+        stream=True,
     )
-    return response.choices[0].message.content
+    async for chunk in response:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            yield delta
 
 
-async def add_message_and_get_response(user_message: str, history: list[dict]) -> str:
-    """Add user message to provided history and get AI response."""
+async def add_message_and_get_response(
+    user_message: str, history: deque[dict], sentence_queue: asyncio.Queue
+) -> str:
+    """
+    Add user message to provided history and get AI response.
+    The history is a bounded deque, so the oldest messages are evicted automatically.
+    Each sentence is put on sentence_queue as soon as it is generated so TTS can start early.
+    """
     history.append({"role": "user", "content": user_message})
-    assistant_response = await get_openai_response(history)
+    response_parts = []
+    buffer = ""
+    async for delta in get_openai_response(history):
+        response_parts.append(delta)
+        buffer += delta
+        end = find_sentence_end(buffer)
+        if end:
+            await sentence_queue.put(buffer[:end].strip())
+            buffer = buffer[end:]
+    if buffer.strip():
+        await sentence_queue.put(buffer.strip())
+    # Store the text exactly as generated, not the sentences rebuilt from stripped chunks
+    assistant_response = "".join(response_parts)
     history.append({"role": "assistant", "content": assistant_response})
-    
-    # Keep only the last 10 pairs (20 messages)
-    if len(history) > 20:
-        history[:] = history[-20:]
-    
     return assistant_response
 
 
+async def generate_response(user_message: str, history: deque[dict], sentence_queue: asyncio.Queue) -> str:
+    """Run add_message_and_get_response, always ending sentence_queue with a None sentinel."""
+    try:
+        return await add_message_and_get_response(user_message, history, sentence_queue)
+    finally:
+        sentence_queue.put_nowait(None)
+
+
+async def fill_audio_queue(audio_stream: AsyncIterator[bytes], audio_queue: asyncio.Queue) -> None:
+    """Read TTS audio into audio_queue as fast as it arrives, ending it with a None sentinel."""
+    try:
+        async for audio_chunk in audio_stream:
+            audio_queue.put_nowait(audio_chunk)
+    except asyncio.CancelledError:
+        # Barge-in: stop pulling audio from ElevenLabs right away
+        await audio_stream.aclose()
+        raise
+    finally:
+        audio_queue.put_nowait(None)
+
+
+class SpeculativeResponse(NamedTuple):
+    """An LLM response started before the end of the user's turn was confirmed."""
+
+    transcript: str
+    generation: asyncio.Task
+    sentence_queue: asyncio.Queue
+
+
+async def warm_up_clients():
+    """Open connections to OpenAI and ElevenLabs so the first call skips DNS and TLS setup."""
+    results = await asyncio.gather(
+        openai_client.models.list(),
+        elevenlabs_client.voices.get(ELEVENLABS_VOICE_ID),
+        return_exceptions=True,
+    )
+    for service, result in zip(("OpenAI", "ElevenLabs"), results):
+        if isinstance(result, Exception):
+            logger.warning("Could not warm up %s connection: %s", service, result)
+
+
+warm_up_task: Optional[asyncio.Task] = None
+
+
+def start_warm_up_in_background():
+    """Warm up API connections without blocking the caller; skipped if a warm-up is already running."""
+    global warm_up_task
+    if warm_up_task is None or warm_up_task.done():
+        warm_up_task = asyncio.create_task(warm_up_clients())
+
+
 # ============================================================================
 # FastAPI Application
 # ============================================================================
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up API connections on startup and close the shared HTTP clients on shutdown."""
+    try:
+        await asyncio.wait_for(warm_up_clients(), timeout=STARTUP_WARM_UP_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("API connection warm-up did not finish within %s seconds", STARTUP_WARM_UP_TIMEOUT)
+    yield
+    await openai_http_client.aclose()
+    await elevenlabs_http_client.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # ============================================================================
 # HTTP Routes
@@ -135,47 +274,41 @@ async def hangup_callback(request: Request):
 async def stream_xml(request: Request):
     """Initialize a Plivo streaming session with bidirectional audio."""
     host = request.headers.get("Host")
+    # API servers close idle connections, so re-warm them before this call's websocket opens
+    start_warm_up_in_background()
 
     # Build Plivo XML response
     plivo_response = plivoxml.ResponseElement()
     # Recording controls (default: enabled)
-    enable_recording = env_flag("ENABLE_RECORDING", default=True)
-    if enable_recording:
+    if CONFIG.enable_recording:
         record_kwargs = {
             "max_length": 86400,
             "record_session": True,
         }
-        # Configure recording callback URL (default to 'auto' if unset/empty)
-        callback_env_raw = os.getenv("RECORDING_CALLBACK_URL")
-        mode = (callback_env_raw or "auto").strip().lower()
-        if mode == "":
-            mode = "auto"
+        # Configure recording callback URL (defaults to 'auto' if unset/empty)
+        mode = CONFIG.recording_callback_mode
         if mode == "auto":
             record_kwargs["callback_url"] = f"http://{host}/recording"
         elif mode == "auto+https":
             record_kwargs["callback_url"] = f"https://{host}/recording"
         else:
-            record_kwargs["callback_url"] = (callback_env_raw or "").strip()
+            record_kwargs["callback_url"] = mode
         plivo_response.add_record(**record_kwargs)
 
-    # WebSocket URL controls
-    # Default WEBSOCKET_URL to 'auto' if unset or empty
-    explicit_ws_url = os.getenv("WEBSOCKET_URL", "auto")
-    mode = (explicit_ws_url or "auto").strip().lower()
-    if mode == "":
-        mode = "auto"
+    # WebSocket URL controls (defaults to 'auto' if unset/empty)
+    mode = CONFIG.ws_url_mode
     if mode == "auto":
         ws_url = f"ws://{host}/stream"
     elif mode == "auto+wss":
         ws_url = f"wss://{host}/stream"
     else:
         # Use as-is
-        ws_url = explicit_ws_url
+        ws_url = mode
     plivo_response.add(
         StreamElement(
             bidirectional=True,
             keepCallAlive=True,
-            contentType=f"{AUDIO_CONTENT_TYPE};rate={AUDIO_SAMPLE_RATE}",
+            contentType=STREAM_CONTENT_TYPE,
             content=ws_url,
         )
     )
@@ -204,134 +337,267 @@ async def stream_websocket_handler(websocket: WebSocket):
         plivo_handler = PlivoFastAPIStreamingHandler(websocket)
         playing = False
         current_stream_id: str | None = None
-        conversation_history_by_stream_id: dict[str, list[dict]] = {}
+        current_history: deque[dict] = deque(maxlen=MAX_HISTORY_MESSAGES)
+        deepgram_audio_buffer = bytearray()
+        deepgram_flush_timer: asyncio.TimerHandle | None = None
+        # Strong references to tail flushes started by the timer, so they are not garbage collected
+        deepgram_flush_tasks: set[asyncio.Task] = set()
+        current_response_task: asyncio.Task | None = None
+        speculative_response: SpeculativeResponse | None = None
 
         async def stream_elevenlabs_audio(text: str):
             """Convert text to speech using ElevenLabs and stream to Plivo."""
             nonlocal playing
-            logger.debug(f"TTS: converting text to speech on stream {current_stream_id or 'unknown'} for text: {text}")
+            logger.debug("TTS: converting text to speech on stream %s for text: %s", current_stream_id or "unknown", text)
             audio_stream = elevenlabs_client.text_to_speech.convert(
                 text=text,
                 voice_id=ELEVENLABS_VOICE_ID,
                 model_id=ELEVENLABS_MODEL_ID,
-                output_format="pcm_16000",
+                output_format=ELEVENLABS_OUTPUT_FORMAT,
             )
+            # Read from ElevenLabs in the background so fetching overlaps with sending to Plivo
+            audio_queue: asyncio.Queue = asyncio.Queue()
+            producer = asyncio.create_task(fill_audio_queue(audio_stream, audio_queue))
             playing = True
-            sample = bytearray()
-            async for audio_chunk in audio_stream:
-                await plivo_handler.send_media(
-                    media_data=audio_chunk,
-                    content_type=AUDIO_CONTENT_TYPE,
-                    sample_rate=AUDIO_SAMPLE_RATE,
-                )
-                sample += audio_chunk
-                await asyncio.sleep(0.015) # Wait for 15ms to allow the audio to play
-            sample_b64 = base64.b64encode(sample).decode("utf-8")
-            logger.debug(f"TTS: text {text} - raw audio bytes: {sample_b64}")
+            # Raw audio is only collected for the debug log below
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            sample_chunks: list[bytes] = []
+            content_type = AUDIO_CONTENT_TYPE
+            sample_rate = AUDIO_SAMPLE_RATE
+            # Pace sends against the playout clock: only sleep when we are ahead of real time
+            loop = asyncio.get_running_loop()
+            started_at = loop.time()
+            sent_bytes = 0
+            try:
+                while (audio_chunk := await audio_queue.get()) is not None:
+                    await plivo_handler.send_media(
+                        media_data=audio_chunk,
+                        content_type=content_type,
+                        sample_rate=sample_rate,
+                    )
+                    if debug_enabled:
+                        sample_chunks.append(audio_chunk)
+                    sent_bytes += len(audio_chunk)
+                    ahead_by = started_at + sent_bytes / AUDIO_BYTES_PER_SECOND - loop.time()
+                    if ahead_by > 0:
+                        await asyncio.sleep(ahead_by)
+                # Surface any error raised while reading from ElevenLabs
+                await producer
+            finally:
+                if not producer.done():
+                    producer.cancel()
+                    await asyncio.gather(producer, return_exceptions=True)
+            if debug_enabled:
+                sample_b64 = base64.b64encode(b"".join(sample_chunks)).decode("utf-8")
+                logger.debug("TTS: text %s - raw audio bytes: %s", text, sample_b64)
+
+        async def speak_sentences(sentence_queue: asyncio.Queue):
+            """Play queued sentences in order until a None sentinel is received."""
+            while (sentence := await sentence_queue.get()) is not None:
+                await stream_elevenlabs_audio(sentence)
             # Send checkpoint to indicate that all audio has been played
             await plivo_handler.send_checkpoint("all_audio_played")
 
+        async def respond_to_user(transcript: str, speculation: Optional[SpeculativeResponse] = None):
+            """
+            Generate the AI response for a user turn and speak it sentence by sentence.
+            A confirmed speculation is played instead of starting a new generation; its user
+            message is already in current_history, so only the assistant reply is added here.
+            """
+            stream_id = current_stream_id or "unknown"
+            if speculation is not None:
+                generation = speculation.generation
+                sentence_queue = speculation.sentence_queue
+            else:
+                sentence_queue = asyncio.Queue()
+                generation = asyncio.create_task(generate_response(transcript, current_history, sentence_queue))
+            tts_task = asyncio.create_task(speak_sentences(sentence_queue))
+            try:
+                ai_response = await generation
+                if speculation is not None:
+                    # The speculation ran on a copy of the history; record its reply now that it is complete
+                    current_history.append({"role": "assistant", "content": ai_response})
+                logger.info("[AIAgent]: %s", ai_response)
+                await tts_task
+            except Exception as e:
+                logger.error("Error responding on stream %s: %s", stream_id, e)
+            finally:
+                # Also reached on barge-in cancellation: stop generating and sending audio
+                for task in (generation, tts_task):
+                    if not task.done():
+                        task.cancel()
+                        await asyncio.gather(task, return_exceptions=True)
+
+        def start_speculative_response(transcript: str):
+            """Start generating a response for a transcript that may still change."""
+            nonlocal speculative_response
+            stream_id = current_stream_id or "unknown"
+            # Work on a copy so an unconfirmed turn never reaches the real history
+            history = copy.copy(current_history)
+            sentence_queue: asyncio.Queue = asyncio.Queue()
+            generation = asyncio.create_task(generate_response(transcript, history, sentence_queue))
+            speculative_response = SpeculativeResponse(transcript, generation, sentence_queue)
+            logger.debug("Speculative response started on stream %s", stream_id)
+
+        async def discard_speculative_response():
+            """Cancel the pending speculative response, if any."""
+            nonlocal speculative_response
+            if speculative_response is None:
+                return
+            generation = speculative_response.generation
+            speculative_response = None
+            if not generation.done():
+                generation.cancel()
+                await asyncio.gather(generation, return_exceptions=True)
+            logger.debug("Speculative response discarded on stream %s", current_stream_id or "unknown")
+
+        async def cancel_current_response():
+            """Cancel the in-flight response, if any, and wait for it to wind down."""
+            if current_response_task and not current_response_task.done():
+                current_response_task.cancel()
+                await asyncio.gather(current_response_task, return_exceptions=True)
+
         async def connect_and_listen_deepgram():
             """Connect to Deepgram and handle transcription events."""
             nonlocal deepgram_connection
-            nonlocal current_stream_id
-            nonlocal conversation_history_by_stream_id
+
+            connect_kwargs = {}
+            if ENABLE_SPECULATIVE_RESPONSES:
+                # Ask Flux for EagerEndOfTurn/TurnResumed events
+                connect_kwargs["eager_eot_threshold"] = str(DEEPGRAM_EAGER_EOT_THRESHOLD)
 
             async with deepgram_client.listen.v2.connect(
                 model=DEEPGRAM_MODEL,
-                encoding="linear16",
+                encoding=DEEPGRAM_ENCODING,
                 sample_rate=str(AUDIO_SAMPLE_RATE),
+                **connect_kwargs,
             ) as connection:
 
                 async def on_deepgram_message(message):
                     nonlocal playing
-                    nonlocal current_stream_id
-                    nonlocal conversation_history_by_stream_id
+                    nonlocal current_response_task
+                    nonlocal speculative_response
                     """Handle incoming Deepgram transcription messages."""
                     if message.type == "TurnInfo" and message.event == "StartOfTurn":
-                        logger.debug(f"TurnInfo: {message.event} for stream {current_stream_id or 'unknown'}")
+                        logger.debug("TurnInfo: %s for stream %s", message.event, current_stream_id or "unknown")
+                    if message.type == "TurnInfo" and message.event == "EagerEndOfTurn":
+                        logger.debug("TurnInfo: %s for stream %s", message.event, current_stream_id or "unknown")
+                        if speculative_response is not None and speculative_response.transcript != message.transcript:
+                            await discard_speculative_response()
+                        # History only changes while a response is in flight, so don't speculate on top of one
+                        idle = current_response_task is None or current_response_task.done()
+                        if speculative_response is None and idle:
+                            start_speculative_response(message.transcript)
+                    if message.type == "TurnInfo" and message.event == "TurnResumed":
+                        logger.debug("TurnInfo: %s for stream %s", message.event, current_stream_id or "unknown")
+                        await discard_speculative_response()
                     if message.type == "TurnInfo" and message.event == "EndOfTurn":
-                        logger.debug(f"TurnInfo: {message.event} for stream {current_stream_id or 'unknown'}")
-                        logger.info(f"[User]: {message.transcript}")
+                        logger.debug("TurnInfo: %s for stream %s", message.event, current_stream_id or "unknown")
+                        logger.info("[User]: %s", message.transcript)
+
+                        speculation = None
+                        if speculative_response is not None and speculative_response.transcript == message.transcript:
+                            speculation = speculative_response
+                            speculative_response = None
+                            logger.debug("Speculative response confirmed on stream %s", current_stream_id or "unknown")
+                        else:
+                            await discard_speculative_response()
+
+                        # Barge-in: stop generating and sending audio for the previous response
+                        await cancel_current_response()
 
-                        # Get AI response for the transcribed text
-                        stream_id = current_stream_id or "unknown"
-                        history = conversation_history_by_stream_id.setdefault(stream_id, [])
-                        ai_response = await add_message_and_get_response(message.transcript, history)
-                        logger.info(f"[AIAgent]: {ai_response}")
+                        if speculation is not None:
+                            # Keep the user's turn even if this response is later cancelled, like the
+                            # non-speculative path, which appends it before generating
+                            current_history.append({"role": "user", "content": message.transcript})
 
-                        # Convert AI response to speech and stream back
                         if playing:
                             # If the audio is still being played to the user, we need to clear the audio buffer
                             await plivo_handler.send_clear_audio()
                             # The audio has been stopped playing to the user, so we can start playing the new audio
                             playing = False
-                        await stream_elevenlabs_audio(ai_response)
+
+                        # Respond in the background so Deepgram messages keep flowing during playback
+                        current_response_task = asyncio.create_task(respond_to_user(message.transcript, speculation))
 
                 deepgram_connection = connection
-                logger.debug(f"Connected to Deepgram for stream {current_stream_id or 'unknown'}")
+                logger.debug("Connected to Deepgram for stream %s", current_stream_id or "unknown")
                 connection.on(EventType.MESSAGE, on_deepgram_message)
                 await connection.start_listening()
 
+        async def flush_deepgram_audio():
+            """Send any buffered caller audio to Deepgram."""
+            if deepgram_audio_buffer and deepgram_connection is not None:
+                audio = bytes(deepgram_audio_buffer)
+                deepgram_audio_buffer.clear()
+                await deepgram_connection.send_media(audio)
+
+        def on_deepgram_flush_timer():
+            """Flush a partial batch so trailing audio never waits more than one batch period."""
+            nonlocal deepgram_flush_timer
+            deepgram_flush_timer = None
+            task = asyncio.create_task(flush_deepgram_audio())
+            deepgram_flush_tasks.add(task)
+            task.add_done_callback(deepgram_flush_tasks.discard)
+
         @plivo_handler.on_media
         async def on_plivo_media(event: MediaEvent):
-            """Forward incoming audio from Plivo to Deepgram for transcription."""
-            if deepgram_connection is not None:
-                await deepgram_connection.send_media(
-                    event.get_raw_media()
+            """Forward incoming audio from Plivo to Deepgram for transcription, a few frames at a time."""
+            nonlocal deepgram_flush_timer
+            if deepgram_connection is None:
+                logger.warning("No Deepgram connection established for stream %s", current_stream_id or "unknown")
+                return
+            deepgram_audio_buffer.extend(event.get_raw_media())
+            if len(deepgram_audio_buffer) >= DEEPGRAM_BATCH_BYTES:
+                if deepgram_flush_timer is not None:
+                    deepgram_flush_timer.cancel()
+                    deepgram_flush_timer = None
+                await flush_deepgram_audio()
+            elif deepgram_flush_timer is None:
+                deepgram_flush_timer = asyncio.get_running_loop().call_later(
+                    DEEPGRAM_BATCH_MS / 1000, on_deepgram_flush_timer
                 )
-            else:
-                logger.warning(f"No Deepgram connection established for stream {current_stream_id or 'unknown'}")
 
         @plivo_handler.on_start
         async def on_start(event: StartEvent):
             """Handle the start event."""
-            logger.info(f"Stream started: {event.start.stream_id} on call {event.start.call_id}")
+            logger.info("Stream started: %s on call %s", event.start.stream_id, event.start.call_id)
             nonlocal current_stream_id
-            nonlocal conversation_history_by_stream_id
             current_stream_id = event.start.stream_id
-            conversation_history_by_stream_id.setdefault(current_stream_id, [])
-            logger.info(f"Conversation history for stream {current_stream_id} initialized")
+            logger.info("Stream %s bound to connection history", current_stream_id)
 
         @plivo_handler.on_disconnected
         async def on_disconnected():
             """Handle the disconnected event."""
-            logger.info("Disconnected from Plivo")
-            nonlocal current_stream_id
-            nonlocal conversation_history_by_stream_id
-            if current_stream_id and current_stream_id in conversation_history_by_stream_id:
-                try:
-                    del conversation_history_by_stream_id[current_stream_id]
-                except KeyError:
-                    pass
-            logger.info(f"Cleared conversation history for stream {current_stream_id or 'unknown'}")
+            logger.info("Disconnected from Plivo stream %s", current_stream_id or "unknown")
+            if deepgram_flush_timer is not None:
+                deepgram_flush_timer.cancel()
+            await discard_speculative_response()
+            await cancel_current_response()
+            current_history.clear()
+            logger.info("Cleared conversation history for stream %s", current_stream_id or "unknown")
 
         @plivo_handler.on_dtmf
         async def on_dtmf(event: DtmfEvent):
             """Handle the DTMF event."""
-            logger.info(f"DTMF detected: {event.dtmf.digit}")
+            logger.info("DTMF detected: %s", event.dtmf.digit)
 
         @plivo_handler.on_cleared_audio
         async def on_cleared_audio(event: ClearedAudioEvent):
             """Handle the cleared audio event."""
-            logger.info(f"Cleared audio: {event.stream_id}")
-
-        @plivo_handler.on_disconnected
-        async def on_disconnected():
-            """Handle the disconnected event."""
-            logger.info(f"Disconnected from Plivo stream {current_stream_id or 'unknown'}")
+            logger.info("Cleared audio: %s", event.stream_id)
 
         @plivo_handler.on_error
         async def on_error(error: Exception):
             """Handle the error event."""
-            logger.error(f"Error: {error}")
+            logger.error("Error: %s", error)
 
         @plivo_handler.on_played_stream
         async def on_played_stream(event: PlayedStreamEvent):
             nonlocal playing
             """Handle the played stream event."""
             # All audio has been played to the user, so we can stop playing
-            logger.info(f"Audio finished playing: {event.name} on stream {event.stream_id}")
+            logger.info("Audio finished playing: %s on stream %s", event.name, event.stream_id)
             playing = False
 
         # Run both Deepgram listener and Plivo handler concurrently
@@ -340,7 +606,7 @@ async def stream_websocket_handler(websocket: WebSocket):
         await asyncio.gather(deepgram_task, plivo_task)
 
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return {"message": "Error occurred"}
 
 
@@ -349,5 +615,11 @@ async def stream_websocket_handler(websocket: WebSocket):
 # ============================================================================
 
 if __name__ == "__main__":
+    from importlib.util import find_spec
+
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvicorn[standard] installs uvloop and httptools except on Windows; use them whenever they are available
+    loop = "uvloop" if find_spec("uvloop") else "asyncio"
+    http = "httptools" if find_spec("httptools") else "h11"
+    logger.info("Starting uvicorn with %s event loop and %s HTTP parser", loop, http)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop=loop, http=http, ws="websockets")
@@ -1,5 +1,51 @@
 import os
 import logging
+from dataclasses import dataclass
+from typing import Optional
+
+# Sample rates Plivo can stream and ElevenLabs can output as raw PCM (output_format="pcm_<rate>")
+SUPPORTED_SAMPLE_RATES = (8000, 16000)
+# Plivo content types the demo can stream without transcoding
+SUPPORTED_CONTENT_TYPES = ("audio/x-l16", "audio/x-mulaw")
+
+_TRUTHY = frozenset({"1", "true", "t", "yes", "y", "on"})
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARN,
+    "warning": logging.WARN,
+    "error": logging.ERROR,
+}
+
+
+@dataclass(frozen=True)
+class Config:
+    """Settings read from the environment once at startup."""
+
+    openai_api_key: str
+    openai_model: str
+    system_prompt: str
+    deepgram_api_key: str
+    deepgram_model: str
+    deepgram_eager_eot_threshold: float
+    elevenlabs_api_key: str
+    elevenlabs_voice_id: str
+    elevenlabs_model_id: str
+    audio_sample_rate: int
+    audio_content_type: str
+    enable_recording: bool
+    enable_speculative_responses: bool
+    # "auto", "auto+https" or an explicit callback URL
+    recording_callback_mode: str
+    # "auto", "auto+wss" or an explicit websocket URL
+    ws_url_mode: str
+
+
+def _url_mode(value: Optional[str], keywords: tuple[str, ...]) -> str:
+    """Normalize a URL setting to one of keywords, or the explicit URL; unset/empty means 'auto'."""
+    value = (value or "").strip()
+    mode = value.lower() or "auto"
+    return mode if mode in keywords else value
 
 
 def env_flag(name: str, default: bool = True) -> bool:
@@ -7,14 +53,17 @@ def env_flag(name: str, default: bool = True) -> bool:
     value = os.getenv(name)
     if value is None:
         return default
-    return value.strip().lower() in {"1", "true", "t", "yes", "y", "on"}
+    return value.strip().lower() in _TRUTHY
 
 
-def validate_and_normalize_env() -> None:
+def validate_and_normalize_env() -> Config:
     """
-    Validate presence of mandatory environment variables and normalize aliases.
+    Validate presence of mandatory environment variables, normalize aliases and
+    return the resulting Config.
     - Supports ELEVEN_LABS_VOICE_ID and ELEVEN_LABS_MODEL_ID as aliases.
-    - Ensures AUDIO_SAMPLE_RATE is an integer.
+    - Ensures AUDIO_SAMPLE_RATE is an integer supported by both Plivo and ElevenLabs.
+    - Ensures AUDIO_CONTENT_TYPE is supported (audio/x-mulaw requires an 8000 Hz rate).
+    - Ensures DEEPGRAM_EAGER_EOT_THRESHOLD, when set, is a number in (0, 1].
     """
     # Normalize known aliases
     if not os.getenv("ELEVENLABS_VOICE_ID") and os.getenv("ELEVEN_LABS_VOICE_ID"):
@@ -39,11 +88,32 @@ def validate_and_normalize_env() -> None:
     # Type validations
     invalid = []
     sample_rate_value = os.getenv("AUDIO_SAMPLE_RATE")
+    sample_rate = None
     if sample_rate_value:
         try:
-            int(sample_rate_value)
+            sample_rate = int(sample_rate_value)
         except ValueError:
             invalid.append("AUDIO_SAMPLE_RATE (must be integer)")
+        else:
+            if sample_rate not in SUPPORTED_SAMPLE_RATES:
+                rates = ", ".join(str(rate) for rate in SUPPORTED_SAMPLE_RATES)
+                invalid.append(f"AUDIO_SAMPLE_RATE (must be one of {rates})")
+    content_type = os.getenv("AUDIO_CONTENT_TYPE")
+    if content_type:
+        if content_type not in SUPPORTED_CONTENT_TYPES:
+            invalid.append(f"AUDIO_CONTENT_TYPE (must be one of {', '.join(SUPPORTED_CONTENT_TYPES)})")
+        elif content_type == "audio/x-mulaw" and sample_rate not in (None, 8000):
+            invalid.append("AUDIO_SAMPLE_RATE (must be 8000 for audio/x-mulaw)")
+    eager_eot_threshold = 0.5
+    eager_eot_threshold_value = os.getenv("DEEPGRAM_EAGER_EOT_THRESHOLD")
+    if eager_eot_threshold_value:
+        try:
+            eager_eot_threshold = float(eager_eot_threshold_value)
+        except ValueError:
+            invalid.append("DEEPGRAM_EAGER_EOT_THRESHOLD (must be a number)")
+        else:
+            if not 0 < eager_eot_threshold <= 1:
+                invalid.append("DEEPGRAM_EAGER_EOT_THRESHOLD (must be greater than 0 and at most 1)")
 
     if missing or invalid:
         messages = []
@@ -53,6 +123,24 @@ def validate_and_normalize_env() -> None:
             messages.append(f"Invalid environment variables: {', '.join(invalid)}")
         raise RuntimeError("; ".join(messages))
 
+    return Config(
+        openai_api_key=os.getenv("OPENAI_API_KEY"),
+        openai_model=os.getenv("OPENAI_MODEL"),
+        system_prompt=os.getenv("SYSTEM_PROMPT"),
+        deepgram_api_key=os.getenv("DEEPGRAM_API_KEY"),
+        deepgram_model=os.getenv("DEEPGRAM_MODEL"),
+        deepgram_eager_eot_threshold=eager_eot_threshold,
+        elevenlabs_api_key=os.getenv("ELEVENLABS_API_KEY"),
+        elevenlabs_voice_id=os.getenv("ELEVENLABS_VOICE_ID"),
+        elevenlabs_model_id=os.getenv("ELEVENLABS_MODEL_ID"),
+        audio_sample_rate=sample_rate,
+        audio_content_type=content_type,
+        enable_recording=env_flag("ENABLE_RECORDING", default=True),
+        enable_speculative_responses=env_flag("ENABLE_SPECULATIVE_RESPONSES", default=False),
+        recording_callback_mode=_url_mode(os.getenv("RECORDING_CALLBACK_URL"), ("auto", "auto+https")),
+        ws_url_mode=_url_mode(os.getenv("WEBSOCKET_URL"), ("auto", "auto+wss")),
+    )
+
 
 def get_log_level_from_env(env_var_name: str = "LOG_LEVEL") -> int:
     """
@@ -61,13 +149,6 @@ def get_log_level_from_env(env_var_name: str = "LOG_LEVEL") -> int:
     Defaults to INFO when unset or unrecognized.
     """
     name = (os.getenv(env_var_name) or "info").strip().lower()
-    mapping = {
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "warn": logging.WARN,
-        "warning": logging.WARN,
-        "error": logging.ERROR,
-    }
-    return mapping.get(name, logging.INFO)
+    return _LOG_LEVELS.get(name, logging.INFO)
 
 
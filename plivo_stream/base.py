@@ -18,6 +18,32 @@ from plivo_stream.types import (
     ConnectionCallback,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Any) -> str:
+    """
+    Serialize to a JSON string, using orjson when it is installed.
+    Falls back to json for payloads orjson rejects (e.g. integers wider than 64 bits),
+    so send_json accepts the same inputs either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data)
+
+
+def _loads(message: str) -> Any:
+    """Parse a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(message)
+    return json.loads(message)
+
 
 class BaseStreamingHandler(ABC):
     """
@@ -142,9 +168,10 @@ class BaseStreamingHandler(ABC):
         )
 
         callbacks = self._callbacks.get(event.event, [])
-        await asyncio.gather(
-            *[callback(event) for callback in callbacks], return_exceptions=True
-        )
+        if callbacks:
+            await asyncio.gather(
+                *[callback(event) for callback in callbacks], return_exceptions=True
+            )
 
         # Special handling for specific event types with dedicated callbacks
         # Parse raw dict into Pydantic models for type safety and attribute access
@@ -161,9 +188,6 @@ class BaseStreamingHandler(ABC):
                 )
             elif event.event == EventType.MEDIA:
                 media_event = MediaEvent(**event.data)
-                media_event.get_raw_media = lambda: base64.b64decode(
-                    media_event.media.payload
-                )
                 await asyncio.gather(
                     *[callback(media_event) for callback in self._media_callbacks],
                     return_exceptions=True,
@@ -228,7 +252,7 @@ class BaseStreamingHandler(ABC):
     async def send_json(self, data: dict[str, Any]):
         """Send JSON data through the WebSocket"""
         try:
-            await self._send_raw(json.dumps(data))
+            await self._send_raw(_dumps(data))
         except Exception as e:
             await self._trigger_error_callbacks(e)
             raise
@@ -298,12 +322,16 @@ class BaseStreamingHandler(ABC):
     async def _process_message(self, message: str):
         """Process incoming WebSocket message"""
         try:
-            data = json.loads(message)
+            data = _loads(message)
             event_type = data.get("event")
 
             if event_type:
                 try:
-                    event = StreamEvent(event=EventType(event_type), data=data)
+                    # The event type is validated by EventType and data is the parsed
+                    # JSON object, so skip re-validating the envelope on every frame
+                    event = StreamEvent.model_construct(
+                        event=EventType(event_type), data=data
+                    )
                     await self._trigger_callbacks(event)
                 except ValueError:
                     # Unknown event type, trigger generic error
@@ -1,8 +1,9 @@
 """Type definitions for Plivo Streaming SDK"""
 
+import base64
 from enum import Enum
 from typing import Any, Callable, Awaitable, Literal, Optional
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class EventType(str, Enum):
@@ -87,9 +88,13 @@ class MediaEvent(BaseModel):
     extra_headers: Optional[str] = Field(
         None, description="Extra headers as JSON string"
     )
-    get_raw_media: Optional[Callable[[], bytes]] = Field(
-        default=None, exclude=True, description="Get raw audio data"
-    )
+    _raw_media: Optional[bytes] = PrivateAttr(default=None)
+
+    def get_raw_media(self) -> bytes:
+        """Get raw audio data, decoded from the base64 payload on first access"""
+        if self._raw_media is None:
+            self._raw_media = base64.b64decode(self.media.payload)
+        return self._raw_media
 
 
 class DtmfData(BaseModel):